@@ -1,6 +1,131 @@
+import json
+
+from django.conf import settings
 from django.contrib import admin
+from django.contrib.admin.options import IncorrectLookupParameters
+from django.contrib.admin.views.main import ORDER_VAR, PAGE_VAR, ChangeList
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
 from .models import Trainer, DemoClass, Feedback
 
+KEYSET_VAR = "before"
+
+
+# ---------------------------
+# Performance mode helpers (ADMIN_PERFORMANCE_MODE=True)
+# ---------------------------
+class EstimatedCountPaginator(Paginator):
+    """
+    On Postgres, use the planner's row estimate instead of COUNT(*) for the
+    unfiltered list once it passes ADMIN_ESTIMATED_COUNT_THRESHOLD. Filtered,
+    searched or keyset (?before=) lists and other databases count at most
+    count_limit rows (by default one past the threshold), since the estimate
+    can overshoot there and link to pages that do not exist; count_capped
+    tells the template the count is only a lower bound.
+    """
+
+    def __init__(self, *args, count_limit=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.count_limit = count_limit or settings.ADMIN_ESTIMATED_COUNT_THRESHOLD + 1
+        self.count_capped = False
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list.order_by()
+        if connections[queryset.db].vendor == "postgresql" and not queryset.query.where:
+            plan = json.loads(queryset.explain(format="json"))
+            if isinstance(plan, list):
+                plan = plan[0]
+            estimate = plan["Plan"]["Plan Rows"]
+            if estimate >= settings.ADMIN_ESTIMATED_COUNT_THRESHOLD:
+                return int(estimate)
+        count = queryset[:self.count_limit].count()
+        self.count_capped = count >= self.count_limit
+        return count
+
+
+class CachedRelatedFieldListFilter(admin.RelatedFieldListFilter):
+    """Related-object filter whose choices are cached instead of queried per page view."""
+
+    def field_choices(self, field, request, model_admin):
+        key = f"admin-filter-choices:{model_admin.opts.label_lower}:{self.field_path}"
+        choices = cache.get(key)
+        if choices is None:
+            choices = super().field_choices(field, request, model_admin)
+            cache.set(key, choices, settings.ADMIN_FILTER_CHOICES_CACHE_SECONDS)
+        return choices
+
+
+class PerformanceChangeList(ChangeList):
+    """
+    Drops the date_hierarchy drill-down (a DISTINCT date scan over the whole
+    table) and adds an "Older entries" link that continues from the last row
+    shown (?before=<pk>) instead of paging with a deep OFFSET.
+    """
+
+    def __init__(self, request, model, list_display, list_display_links, list_filter, date_hierarchy, *args, **kwargs):
+        super().__init__(request, model, list_display, list_display_links, list_filter, None, *args, **kwargs)
+
+    def get_filters_params(self, params=None):
+        lookup_params = super().get_filters_params(params)
+        lookup_params.pop(KEYSET_VAR, None)
+        return lookup_params
+
+    def get_queryset(self, request, exclude_parameters=None):
+        queryset = super().get_queryset(request, exclude_parameters)
+        if KEYSET_VAR in self.params:
+            try:
+                queryset = queryset.filter(pk__lt=int(self.params[KEYSET_VAR]))
+            except ValueError as e:
+                raise IncorrectLookupParameters(e)
+        return queryset
+
+    def get_results(self, request):
+        super().get_results(request)
+        # Only valid while the list is in its default newest-first order
+        self.older_url = None
+        rows = list(self.result_list)
+        if len(rows) >= self.list_per_page and ORDER_VAR not in self.params:
+            self.older_url = self.get_query_string({KEYSET_VAR: rows[-1].pk}, [PAGE_VAR])
+
+
+class PerformanceModeAdmin(admin.ModelAdmin):
+    """
+    With ADMIN_PERFORMANCE_MODE on: estimated instead of exact COUNT(*) on
+    large unfiltered lists, no full-table count, no date_hierarchy scan, and
+    newest-first keyset navigation instead of deep OFFSET pages. With it off
+    the changelist behaves like a plain ModelAdmin.
+    """
+
+    def performance_mode(self):
+        return settings.ADMIN_PERFORMANCE_MODE
+
+    @property
+    def show_full_result_count(self):
+        return not self.performance_mode()
+
+    def get_ordering(self, request):
+        if self.performance_mode():
+            return ('-pk',)
+        return super().get_ordering(request)
+
+    def get_paginator(self, request, queryset, per_page, orphans=0, allow_empty_first_page=True):
+        if self.performance_mode():
+            # A keyset page only needs to know whether there is a next page;
+            # counting past list_max_show_all keeps "Show all" off when capped
+            count_limit = max(per_page, self.list_max_show_all) + 1 if KEYSET_VAR in request.GET else None
+            return EstimatedCountPaginator(
+                queryset, per_page, orphans, allow_empty_first_page, count_limit=count_limit
+            )
+        return super().get_paginator(request, queryset, per_page, orphans, allow_empty_first_page)
+
+    def get_changelist(self, request, **kwargs):
+        if self.performance_mode():
+            return PerformanceChangeList
+        return super().get_changelist(request, **kwargs)
+
 
 @admin.register(Trainer)
 class TrainerAdmin(admin.ModelAdmin):
@@ -10,15 +135,17 @@ class TrainerAdmin(admin.ModelAdmin):
 
 
 @admin.register(DemoClass)
-class DemoClassAdmin(admin.ModelAdmin):
+class DemoClassAdmin(PerformanceModeAdmin):
     list_display = ('title', 'trainer', 'date', 'duration_minutes', 'is_active')
-    list_filter = ('trainer', 'is_active')
+    list_select_related = ('trainer',)
+    list_filter = (('trainer', CachedRelatedFieldListFilter), 'is_active')
     search_fields = ('title',)
 
 
 @admin.register(Feedback)
-class FeedbackAdmin(admin.ModelAdmin):
+class FeedbackAdmin(PerformanceModeAdmin):
     list_display = ('student_name','demo_class', 'rating', 'would_recommend', 'created_at')
-    list_filter = ('rating', 'would_recommend', 'demo_class__trainer')
+    list_select_related = ('demo_class__trainer',)
+    list_filter = ('rating', 'would_recommend', ('demo_class__trainer', CachedRelatedFieldListFilter))
     search_fields = ('student_name', 'student_email', 'liked_most', 'to_improve')
     date_hierarchy = 'created_at'
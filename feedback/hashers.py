@@ -0,0 +1,35 @@
+from django.conf import settings
+from django.contrib.auth.hashers import (
+    Argon2PasswordHasher,
+    PBKDF2PasswordHasher,
+    ScryptPasswordHasher,
+)
+
+
+def _cost(name, default):
+    value = getattr(settings, name, None)
+    return int(value) if value else default
+
+
+# ---------------------------
+# Tuned hashers (cost parameters come from settings)
+#
+# Each subclass keeps the algorithm name of its parent, so hashes written by
+# the stock Django hasher still verify. When the configured cost differs from
+# the one stored in a user's hash, must_update() returns True and Django
+# re-hashes the password on the next successful login.
+# ---------------------------
+class TunedPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    iterations = _cost("PBKDF2_ITERATIONS", PBKDF2PasswordHasher.iterations)
+
+
+class TunedScryptPasswordHasher(ScryptPasswordHasher):
+    work_factor = _cost("SCRYPT_WORK_FACTOR", ScryptPasswordHasher.work_factor)
+    block_size = _cost("SCRYPT_BLOCK_SIZE", ScryptPasswordHasher.block_size)
+    parallelism = _cost("SCRYPT_PARALLELISM", ScryptPasswordHasher.parallelism)
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    time_cost = _cost("ARGON2_TIME_COST", Argon2PasswordHasher.time_cost)
+    memory_cost = _cost("ARGON2_MEMORY_COST", Argon2PasswordHasher.memory_cost)
+    parallelism = _cost("ARGON2_PARALLELISM", Argon2PasswordHasher.parallelism)
@@ -0,0 +1,71 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the cost of getting a database connection per request with "
+        "reusing an open one. Run once with DB_POOL=False and once with "
+        "DB_POOL=True to see how much connection setup the pool removes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=200,
+            help="Requests simulated per mode (default: 200).",
+        )
+
+    def handle(self, *args, **options):
+        iterations = options["iterations"]
+        if iterations < 1:
+            raise CommandError("--iterations must be at least 1.")
+        pooled = getattr(connection, "pool", None) is not None
+        self.stdout.write(
+            f"{connection.vendor}, pool {'on' if pooled else 'off'}, {iterations} iterations"
+        )
+
+        # Warm up: open the pool / first connection outside the timings
+        self._query()
+
+        def reconnect():
+            # What a request pays with CONN_MAX_AGE=0: with the pool on this
+            # is a checkout, without it a full (TLS) connect
+            connection.close()
+            self._query()
+
+        self._report("connect + SELECT 1", self._measure(reconnect, iterations))
+        self._report("reused  + SELECT 1", self._measure(self._query, iterations))
+
+        if pooled:
+            stats = connection.pool.get_stats()
+            self.stdout.write(
+                f"pool: {stats.get('requests_num', 0)} checkouts, "
+                f"{stats.get('requests_wait_ms', 0)} ms total wait, "
+                f"{stats.get('connections_num', 0)} connections opened"
+            )
+        connection.close()
+
+    def _query(self):
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+            cursor.fetchone()
+
+    def _measure(self, func, iterations):
+        timings = []
+        for _ in range(iterations):
+            started = time.perf_counter()
+            func()
+            timings.append((time.perf_counter() - started) * 1000)
+        return timings
+
+    def _report(self, label, timings):
+        timings.sort()
+        p95 = timings[int(len(timings) * 0.95) - 1]
+        self.stdout.write(
+            f"{label}  mean {statistics.mean(timings):7.3f} ms   p95 {p95:7.3f} ms"
+        )
@@ -0,0 +1,62 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.module_loading import import_string
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure password verifications per second on a single core for each "
+        "hasher profile in PASSWORD_HASHER_PROFILES. Password checking is what "
+        "dominates CPU time in login_user, so this approximates logins/sec/core."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--profile",
+            action="append",
+            dest="profiles",
+            help="Profile to benchmark (repeatable). Defaults to all profiles.",
+        )
+        parser.add_argument(
+            "--seconds",
+            type=float,
+            default=2.0,
+            help="How long to run each profile (default: 2).",
+        )
+
+    def handle(self, *args, **options):
+        profiles = options["profiles"] or list(settings.PASSWORD_HASHER_PROFILES)
+        unknown = set(profiles) - set(settings.PASSWORD_HASHER_PROFILES)
+        if unknown:
+            raise CommandError(f"Unknown profile(s): {', '.join(sorted(unknown))}")
+        if options["seconds"] <= 0:
+            raise CommandError("--seconds must be greater than 0.")
+
+        for name in profiles:
+            hasher = import_string(settings.PASSWORD_HASHER_PROFILES[name][0])()
+            try:
+                encoded = hasher.encode("benchmark-password", hasher.salt())
+            except ValueError as exc:
+                # Optional hashing library (e.g. argon2-cffi) not installed
+                self.stdout.write(self.style.WARNING(f"{name:<8} skipped: {exc}"))
+                continue
+
+            verified = 0
+            started = time.perf_counter()
+            deadline = started + options["seconds"]
+            while time.perf_counter() < deadline:
+                hasher.verify("benchmark-password", encoded)
+                verified += 1
+            elapsed = time.perf_counter() - started
+
+            self.stdout.write(
+                f"{name:<8} {verified / elapsed:8.1f} logins/sec/core  "
+                f"{elapsed / verified * 1000:7.1f} ms/login  "
+                f"({hasher.algorithm}: {self._params(hasher)})"
+            )
+
+    def _params(self, hasher):
+        fields = ("iterations", "work_factor", "block_size", "time_cost", "memory_cost", "parallelism")
+        return ", ".join(f"{f}={getattr(hasher, f)}" for f in fields if hasattr(hasher, f))
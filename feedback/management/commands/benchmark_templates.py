@@ -0,0 +1,93 @@
+import statistics
+import time
+from datetime import timedelta
+
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand, CommandError
+from django.template.loader import render_to_string
+from django.test import RequestFactory
+from django.utils import timezone
+
+from feedback.models import DemoClass, Trainer
+
+
+class Command(BaseCommand):
+    help = (
+        "Render the class list templates with a large in-memory class list "
+        "and report time per render, with the card fragment cache cold and warm. "
+        "No database rows are needed."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--classes",
+            type=int,
+            default=2000,
+            help="Number of demo classes in the list (default: 2000).",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=20,
+            help="Renders per measurement (default: 20).",
+        )
+
+    def handle(self, *args, **options):
+        for option in ("classes", "repeat"):
+            if options[option] < 1:
+                raise CommandError(f"--{option} must be at least 1.")
+
+        classes = self._build_classes(options["classes"])
+        request = RequestFactory().get("/")
+        request.user = AnonymousUser()
+
+        templates = {
+            "reviews/demo_class_list.html": lambda version: {
+                "classes": classes,
+                "classes_version": version,
+            },
+            "reviews/feedback_summary.html": lambda version: {
+                "per_class": classes,
+                "overall": {"total_feedback": len(classes) * 12, "avg_rating": 4.1},
+                "summary_version": version,
+            },
+        }
+
+        self.stdout.write(f"{options['classes']} classes, {options['repeat']} renders each")
+        for name, context in templates.items():
+            # A fresh version per render misses the fragment cache every time
+            cold = self._measure(
+                lambda i: render_to_string(name, context(f"cold-{time.time_ns()}-{i}"), request),
+                options["repeat"],
+            )
+            render_to_string(name, context("warm"), request)
+            warm = self._measure(
+                lambda i: render_to_string(name, context("warm"), request),
+                options["repeat"],
+            )
+            self.stdout.write(f"{name:<32} cold {cold:8.2f} ms   warm {warm:8.2f} ms")
+
+    def _measure(self, render, repeat):
+        timings = []
+        for i in range(repeat):
+            started = time.perf_counter()
+            render(i)
+            timings.append((time.perf_counter() - started) * 1000)
+        return statistics.median(timings)
+
+    def _build_classes(self, count):
+        trainers = [Trainer(pk=i, name=f"Trainer {i}") for i in range(1, 51)]
+        start = timezone.now()
+        classes = []
+        for i in range(1, count + 1):
+            demo_class = DemoClass(
+                pk=i,
+                title=f"Demo class {i}",
+                trainer=trainers[i % len(trainers)],
+                date=start + timedelta(hours=i),
+                duration_minutes=60,
+            )
+            demo_class.feedback_count = i % 40
+            demo_class.avg_rating = 3 + (i % 20) / 10
+            classes.append(demo_class)
+        return classes
@@ -0,0 +1,76 @@
+import json
+import sys
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from feedback.models import FeedbackChange
+
+
+class Command(BaseCommand):
+    help = (
+        "Write Feedback changes after a checkpoint as JSON lines, one change "
+        "per line, so downstream sync only reads what changed."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--after",
+            type=int,
+            help="Export changes with seq greater than this value.",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            help=(
+                "File holding the last exported seq. Read on start (unless "
+                "--after is given) and rewritten after every batch."
+            ),
+        )
+        parser.add_argument(
+            "--output",
+            help="JSONL file to append to (default: stdout).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Changes fetched per query (default: 1000).",
+        )
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be at least 1.")
+        checkpoint = Path(options["checkpoint"]) if options["checkpoint"] else None
+        after = options["after"]
+        if after is None:
+            after = self._read_checkpoint(checkpoint)
+
+        out = open(options["output"], "a", encoding="utf-8") if options["output"] else sys.stdout
+        exported = 0
+        try:
+            while True:
+                batch = list(FeedbackChange.objects.since(after)[:options["batch_size"]])
+                if not batch:
+                    break
+
+                for change in batch:
+                    out.write(json.dumps(change.as_dict()) + "\n")
+                out.flush()
+
+                after = batch[-1].seq
+                exported += len(batch)
+                if checkpoint:
+                    checkpoint.write_text(f"{after}\n")
+        finally:
+            if out is not sys.stdout:
+                out.close()
+
+        self.stderr.write(f"Exported {exported} changes; last seq {after}.")
+
+    def _read_checkpoint(self, checkpoint):
+        if not checkpoint or not checkpoint.exists():
+            return 0
+        try:
+            return int(checkpoint.read_text().strip() or 0)
+        except ValueError:
+            raise CommandError(f"Checkpoint file {checkpoint} does not contain a seq.")
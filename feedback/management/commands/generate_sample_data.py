@@ -0,0 +1,254 @@
+import itertools
+import random
+from bisect import bisect
+from datetime import datetime, time, timedelta, timezone as dt_timezone
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils.dateparse import parse_date, parse_datetime
+
+from feedback.models import DemoClass, Feedback, Profile, Trainer
+
+TOPICS = [
+    "Python", "Django", "Data Science", "Machine Learning", "SQL", "React",
+    "DevOps", "Cloud", "Java", "Testing", "UI Design", "Cyber Security",
+]
+FIRST_NAMES = [
+    "Aarav", "Priya", "Rahul", "Sneha", "Vikram", "Ananya", "Karthik", "Divya",
+    "Arjun", "Meera", "Rohan", "Kavya", "Sai", "Lakshmi", "Nikhil", "Pooja",
+]
+WORDS = (
+    "clear explanation examples pace trainer session hands-on practice questions "
+    "slides demo project concepts helpful interactive audio time more less "
+    "doubts notes code exercises real-world topics useful engaging detailed"
+).split()
+
+# Demo feedback skews positive
+RATING_WEIGHTS = [0.04, 0.06, 0.15, 0.35, 0.40]
+BATCH_LOG_EVERY = 20
+# Fixed "today" for generated dates so reruns match; see --anchor
+DEFAULT_ANCHOR = "2025-01-01T00:00:00Z"
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate synthetic trainers, demo classes, users/profiles and feedback "
+        "for local load testing. Output is deterministic for a given --seed, "
+        "--anchor and row counts (whatever the --batch-size), and rows are written with bulk_create in fixed-size batches, so memory "
+        "stays flat however many rows are requested. Feedback written this way "
+        "bypasses signals and so does not appear in the change feed."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--trainers", type=int, default=50)
+        parser.add_argument("--classes", type=int, default=2000)
+        parser.add_argument("--users", type=int, default=10000)
+        parser.add_argument("--feedback", type=int, default=100000)
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=365,
+            help="Spread class dates over this many days before --anchor (default: 365).",
+        )
+        parser.add_argument(
+            "--anchor",
+            default=DEFAULT_ANCHOR,
+            help=(
+                "Date or datetime the data is generated around; classes are "
+                f"scheduled up to 30 days after it (default: {DEFAULT_ANCHOR}). "
+                "Pass today's date to get upcoming classes relative to now."
+            ),
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=42,
+            help="Random seed; also part of every generated email, so use a new seed for each run.",
+        )
+        parser.add_argument("--batch-size", type=int, default=5000)
+
+    def handle(self, *args, **options):
+        for option in ("trainers", "classes", "users", "feedback", "days"):
+            if options[option] < 0:
+                raise CommandError(f"--{option} cannot be negative.")
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be at least 1.")
+        if options["classes"] and not options["trainers"]:
+            raise CommandError("--classes needs at least one trainer.")
+
+        self.seed = options["seed"]
+        self.rng = random.Random(self.seed)
+        # Separate stream, so the row stream does not depend on --batch-size
+        weight_rng = random.Random(f"{self.seed}:class-weights")
+        self.batch_size = options["batch_size"]
+        self.anchor = self._parse_anchor(options["anchor"])
+
+        suffix = f".s{self.seed}@example.com"
+        if User.objects.filter(username__endswith=suffix).exists() or \
+                Trainer.objects.filter(email__endswith=suffix).exists():
+            raise CommandError(
+                f"Sample data for --seed {self.seed} already exists; use a different --seed."
+            )
+
+        trainers = self._write(Trainer, self._trainers(options["trainers"]))
+        self.stdout.write(f"Created {len(trainers)} trainers")
+
+        # Only ids, end times and popularity weights are kept per class
+        class_ids, class_ends, cum_weights = [], [], []
+        total_weight = 0.0
+        for batch in self._batches(self._classes(options["classes"], trainers, options["days"])):
+            for demo_class in self._bulk_create(DemoClass, batch):
+                ends_at = demo_class.date + timedelta(minutes=demo_class.duration_minutes)
+                class_ids.append(demo_class.pk)
+                class_ends.append(ends_at)
+                # Popular classes collect several times the feedback of quiet
+                # ones; classes that have not ended by the anchor get none
+                weight = weight_rng.lognormvariate(0, 1)
+                if ends_at < self.anchor:
+                    total_weight += weight
+                cum_weights.append(total_weight)
+        self.stdout.write(f"Created {len(class_ids)} demo classes")
+
+        password = make_password("password123")
+        users = 0
+        for batch in self._batches(self._users(options["users"], password)):
+            created = self._bulk_create(User, batch)
+            Profile.objects.bulk_create(
+                [Profile(user=user, mobile=f"9{self.rng.randrange(10**9):09d}") for user in created]
+            )
+            users += len(created)
+        self.stdout.write(f"Created {users} users with profiles")
+
+        if not total_weight:
+            if options["feedback"]:
+                self.stdout.write(self.style.WARNING("No finished demo classes, skipping feedback"))
+            return
+
+        # created_at is auto_now_add; switch that off so the generated
+        # timestamps are kept
+        created_at = Feedback._meta.get_field("created_at")
+        created_at.auto_now_add = False
+        try:
+            feedback = self._feedback(options["feedback"], options["users"], class_ids, class_ends, cum_weights)
+            written = 0
+            for number, batch in enumerate(self._batches(feedback), start=1):
+                self._bulk_create(Feedback, batch)
+                written += len(batch)
+                if number % BATCH_LOG_EVERY == 0:
+                    self.stdout.write(f"  {written} feedback rows...")
+        finally:
+            created_at.auto_now_add = True
+        self.stdout.write(self.style.SUCCESS(f"Created {written} feedback rows"))
+
+    def _parse_anchor(self, value):
+        anchor = parse_datetime(value)
+        if anchor is None and parse_date(value):
+            anchor = datetime.combine(parse_date(value), time())
+        if anchor is None:
+            raise CommandError(f"--anchor {value!r} is not a valid date or datetime.")
+        if anchor.tzinfo is None:
+            anchor = anchor.replace(tzinfo=dt_timezone.utc)
+        return anchor.replace(minute=0, second=0, microsecond=0)
+
+    # ---------------------------
+    # Batching helpers
+    # ---------------------------
+    def _batches(self, rows):
+        rows = iter(rows)
+        while batch := list(itertools.islice(rows, self.batch_size)):
+            yield batch
+
+    def _bulk_create(self, model, batch):
+        with transaction.atomic():
+            return model.objects.bulk_create(batch)
+
+    def _write(self, model, rows):
+        created = []
+        for batch in self._batches(rows):
+            created.extend(self._bulk_create(model, batch))
+        return created
+
+    # ---------------------------
+    # Row generators
+    # ---------------------------
+    def _trainers(self, count):
+        for n in range(1, count + 1):
+            topic = self.rng.choice(TOPICS)
+            yield Trainer(
+                name=f"{self.rng.choice(FIRST_NAMES)} Trainer {n}",
+                expertise=f"{topic}, {self.rng.choice(TOPICS)}",
+                email=f"trainer{n}.s{self.seed}@example.com",
+            )
+
+    def _classes(self, count, trainers, days):
+        for n in range(1, count + 1):
+            # Mostly past classes, some upcoming; afternoon/evening slots
+            day = self.rng.randint(-days, 30)
+            date = self.anchor + timedelta(days=day)
+            date = date.replace(hour=self.rng.choice([10, 14, 16, 18, 19, 20]))
+            yield DemoClass(
+                title=f"{self.rng.choice(TOPICS)} demo #{n}",
+                trainer=self.rng.choice(trainers),
+                date=date,
+                duration_minutes=self.rng.choice([45, 60, 60, 90, 120]),
+                description=self._text(12, 0.6),
+                is_active=day >= -14 or self.rng.random() < 0.1,
+            )
+
+    def _users(self, count, password):
+        for n in range(1, count + 1):
+            email = self._student_email(n)
+            yield User(
+                username=email,
+                email=email,
+                first_name=self._student_name(n),
+                password=password,
+            )
+
+    def _feedback(self, count, users, class_ids, class_ends, cum_weights):
+        total_weight = cum_weights[-1]
+        for _ in range(count):
+            index = bisect(cum_weights, self.rng.random() * total_weight)
+            index = min(index, len(class_ids) - 1)
+            student = self.rng.randint(1, max(users, 1))
+            rating = self.rng.choices(range(1, 6), weights=RATING_WEIGHTS)[0]
+
+            ends_at = class_ends[index]
+            delay = self._delay((self.anchor - ends_at).total_seconds() / 60)
+
+            yield Feedback(
+                demo_class_id=class_ids[index],
+                student_name=self._student_name(student),
+                student_email=self._student_email(student),
+                rating=rating,
+                liked_most=self._text(10, 0.8),
+                to_improve=self._text(6, 1.0) if rating < 5 or self.rng.random() < 0.3 else "",
+                would_recommend=self.rng.random() < (rating / 5) ** 1.5,
+                created_at=ends_at + timedelta(minutes=delay),
+                source="paper" if self.rng.random() < 0.1 else "digital",
+            )
+
+    def _delay(self, limit):
+        # Most feedback lands within the hour after class; a long tail
+        # trickles in for days. Delays past the anchor are redrawn rather
+        # than clamped, so they do not pile up on the anchor itself.
+        while True:
+            if self.rng.random() < 0.85:
+                delay = self.rng.expovariate(1 / 15)
+            else:
+                delay = self.rng.expovariate(1 / (60 * 24))
+            if delay <= limit:
+                return delay
+
+    def _student_email(self, n):
+        return f"student{n}.s{self.seed}@example.com"
+
+    def _student_name(self, n):
+        return f"{FIRST_NAMES[n % len(FIRST_NAMES)]} {n}"
+
+    def _text(self, median_words, sigma):
+        # Log-normal word counts: mostly short comments, a few long ones
+        words = max(1, min(400, int(self.rng.lognormvariate(0, sigma) * median_words)))
+        return " ".join(self.rng.choices(WORDS, k=words)).capitalize() + "."
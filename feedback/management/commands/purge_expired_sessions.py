@@ -0,0 +1,53 @@
+import time
+
+from django.contrib.sessions.models import Session
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete expired rows from django_session in small chunks, so a large "
+        "backlog does not hold one long-running DELETE against live traffic."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=5000,
+            help="Sessions deleted per statement (default: 5000).",
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=0.0,
+            help="Seconds to pause between chunks (default: 0).",
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options["chunk_size"]
+        if chunk_size < 1:
+            raise CommandError("--chunk-size must be at least 1.")
+        now = timezone.now()
+        total = 0
+
+        while True:
+            keys = list(
+                Session.objects.filter(expire_date__lt=now)
+                .values_list("session_key", flat=True)[:chunk_size]
+            )
+            if not keys:
+                break
+
+            # Re-check the expiry: a session renewed since the SELECT is kept
+            deleted, _ = Session.objects.filter(session_key__in=keys, expire_date__lt=now).delete()
+            total += deleted
+            self.stdout.write(f"Deleted {deleted} sessions ({total} so far)")
+
+            if len(keys) < chunk_size:
+                break
+            if options["sleep"]:
+                time.sleep(options["sleep"])
+
+        self.stdout.write(self.style.SUCCESS(f"Purged {total} expired sessions."))
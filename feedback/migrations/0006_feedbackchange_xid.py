@@ -0,0 +1,22 @@
+# Generated by Django 5.1.5 on 2026-10-19 11:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('feedback', '0005_democlass_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='feedbackchange',
+            name='xid',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='feedbackchange',
+            index=models.Index(fields=['xid', 'seq'], name='feedbackchange_xid_seq'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.1.5 on 2026-10-19 11:40
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('feedback', '0006_feedbackchange_xid'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='trainer',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+    ]
@@ -1,5 +1,9 @@
-from django.db import models
+from django.db import DEFAULT_DB_ALIAS, NotSupportedError, connections, models, router, transaction
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
 from django.contrib.auth.models import User
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
 
 class Profile(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE)
@@ -12,6 +16,7 @@ class Trainer(models.Model):
     name = models.CharField(max_length=100)
     expertise = models.CharField(max_length=200, blank=True)
     email = models.EmailField(blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return self.name
@@ -24,6 +29,7 @@ class DemoClass(models.Model):
     duration_minutes = models.PositiveIntegerField(default=60)
     description = models.TextField(blank=True)
     is_active = models.BooleanField(default=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return f"{self.title} ({self.trainer.name})"
@@ -54,3 +60,89 @@ class Feedback(models.Model):
 
     def __str__(self):
         return f"Feedback for {self.demo_class} - {self.rating} stars"
+
+    def save(self, *args, **kwargs):
+        # The post_save signal writes the FeedbackChange row; keep both in one
+        # transaction so a failed log insert rolls the save back too.
+        # (delete() already runs its signals inside a transaction.)
+        with transaction.atomic(using=kwargs.get("using") or router.db_for_write(Feedback, instance=self)):
+            super().save(*args, **kwargs)
+
+
+# Postgres transaction ids as bigint (xid8 has no direct cast)
+CURRENT_XID = "pg_current_xact_id()::text::bigint"
+# Oldest transaction still in flight; every xid below it has finished
+OLDEST_OPEN_XID = "pg_snapshot_xmin(pg_current_snapshot())::text::bigint"
+
+
+class FeedbackChangeQuerySet(models.QuerySet):
+    def since(self, seq):
+        """
+        Changes after the change with this seq (0 for the start), in commit
+        order, never skipping one that commits later.
+
+        Sequence values are handed out at insert time but become visible at
+        commit time, so on Postgres a slow transaction can commit a lower seq
+        after a higher one. There each row carries the id of the transaction
+        that wrote it, and only rows from transactions older than the oldest
+        one still open are returned, ordered by (xid, seq): anything that
+        commits later has a higher xid and sorts after them. Nothing is
+        locked, but one long-open transaction holds the feed back until it
+        ends. SQLite lets one transaction write at a time, so there seqs
+        commit in order.
+        """
+        vendor = connections[self.db].vendor
+        if vendor == "sqlite":
+            return self.filter(seq__gt=seq).order_by("seq")
+        if vendor != "postgresql":
+            raise NotSupportedError(f"The change feed does not support {vendor}.")
+
+        after_xid = self.filter(seq=seq).values_list("xid", flat=True).first() or 0
+        return self.filter(
+            Q(xid__gt=after_xid) | Q(xid=after_xid, seq__gt=seq),
+            xid__lt=RawSQL(OLDEST_OPEN_XID, []),
+        ).order_by("xid", "seq")
+
+
+class FeedbackChange(models.Model):
+    """Append-only log of Feedback writes, read by the warehouse sync."""
+
+    INSERT = "insert"
+    UPDATE = "update"
+    DELETE = "delete"
+    ACTION_CHOICES = [
+        (INSERT, "Insert"),
+        (UPDATE, "Update"),
+        (DELETE, "Delete"),
+    ]
+
+    seq = models.BigAutoField(primary_key=True)
+    feedback_id = models.BigIntegerField(db_index=True)
+    action = models.CharField(max_length=10, choices=ACTION_CHOICES)
+    changed_at = models.DateTimeField(default=timezone.now)
+    data = models.JSONField(null=True, blank=True, encoder=DjangoJSONEncoder)
+    # Writing transaction on Postgres (0 elsewhere); see since()
+    xid = models.BigIntegerField(default=0)
+
+    objects = FeedbackChangeQuerySet.as_manager()
+
+    class Meta:
+        indexes = [models.Index(fields=["xid", "seq"], name="feedbackchange_xid_seq")]
+
+    @classmethod
+    def record(cls, feedback_id, action, data=None, using=DEFAULT_DB_ALIAS):
+        """Append a change; must run inside the transaction that made it."""
+        xid = RawSQL(CURRENT_XID, []) if connections[using].vendor == "postgresql" else 0
+        return cls.objects.using(using).create(feedback_id=feedback_id, action=action, data=data, xid=xid)
+
+    def __str__(self):
+        return f"#{self.seq} {self.action} feedback {self.feedback_id}"
+
+    def as_dict(self):
+        return {
+            "seq": self.seq,
+            "feedback_id": self.feedback_id,
+            "action": self.action,
+            "changed_at": self.changed_at.isoformat(),
+            "data": self.data,
+        }
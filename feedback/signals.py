@@ -0,0 +1,39 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Feedback, FeedbackChange
+
+
+def feedback_snapshot(feedback):
+    return {
+        "id": feedback.pk,
+        "demo_class_id": feedback.demo_class_id,
+        "student_name": feedback.student_name,
+        "student_email": feedback.student_email,
+        "rating": feedback.rating,
+        "liked_most": feedback.liked_most,
+        "to_improve": feedback.to_improve,
+        "would_recommend": feedback.would_recommend,
+        "created_at": feedback.created_at,
+        "source": feedback.source,
+    }
+
+
+# ---------------------------
+# Change feed (note: bulk_create / queryset.update() bypass these)
+# ---------------------------
+@receiver(post_save, sender=Feedback)
+def record_feedback_save(sender, instance, created, raw=False, using=None, **kwargs):
+    if raw:
+        return
+    FeedbackChange.record(
+        instance.pk,
+        FeedbackChange.INSERT if created else FeedbackChange.UPDATE,
+        data=feedback_snapshot(instance),
+        using=using,
+    )
+
+
+@receiver(post_delete, sender=Feedback)
+def record_feedback_delete(sender, instance, using=None, **kwargs):
+    FeedbackChange.record(instance.pk, FeedbackChange.DELETE, using=using)
@@ -1,3 +1,443 @@
-from django.test import TestCase
+import json
+import tempfile
+import threading
+from datetime import datetime, timedelta, timezone as dt_timezone
+from io import StringIO
+from pathlib import Path
+from unittest import mock, skipUnless
 
-# Create your tests here.
+from django.conf import settings
+from django.contrib.auth import authenticate
+from django.contrib.auth.models import User
+from django.contrib.sessions.models import Session
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.db import DatabaseError, connection, connections, transaction
+from django.db.models import QuerySet
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from .admin import EstimatedCountPaginator
+from .hashers import TunedArgon2PasswordHasher, TunedPBKDF2PasswordHasher, TunedScryptPasswordHasher
+from .models import DemoClass, Feedback, FeedbackChange, Profile, Trainer
+
+
+class FeedbackFixtures:
+    """A trainer, one of their demo classes and a student account."""
+
+    @classmethod
+    def create_fixtures(cls):
+        cls.trainer = Trainer.objects.create(name="Asha")
+        cls.demo_class = DemoClass.objects.create(title="Django basics", trainer=cls.trainer, date=timezone.now())
+        cls.student = User.objects.create_user("student@example.com", "student@example.com")
+
+    def create_feedback(self, rating=4):
+        return Feedback.objects.create(
+            demo_class=self.demo_class,
+            student_name="Ravi",
+            student_email="ravi@example.com",
+            rating=rating,
+            liked_most="Examples",
+            to_improve="Pace",
+        )
+
+
+class FeedbackTestCase(FeedbackFixtures, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.create_fixtures()
+
+
+@mock.patch.object(TunedPBKDF2PasswordHasher, "iterations", 1000)
+class PasswordHasherProfileTests(TestCase):
+    def create_user(self):
+        return User.objects.create_user("student@example.com", "student@example.com", "s3cret-pass")
+
+    def login(self):
+        return authenticate(username="student@example.com", password="s3cret-pass")
+
+    def test_cost_change_rehashes_on_login(self):
+        user = self.create_user()
+        self.assertTrue(user.password.startswith("pbkdf2_sha256$1000$"))
+
+        with mock.patch.object(TunedPBKDF2PasswordHasher, "iterations", 2000):
+            self.assertEqual(self.login(), user)
+            user.refresh_from_db()
+            self.assertTrue(user.password.startswith("pbkdf2_sha256$2000$"))
+
+    @mock.patch.object(TunedScryptPasswordHasher, "work_factor", 2**10)
+    def test_profile_switch_rehashes_on_login(self):
+        user = self.create_user()
+
+        with override_settings(PASSWORD_HASHERS=settings.PASSWORD_HASHER_PROFILES["scrypt"]):
+            self.assertEqual(self.login(), user)
+            user.refresh_from_db()
+            self.assertTrue(user.password.startswith("scrypt$1024$"))
+
+    @mock.patch.object(TunedArgon2PasswordHasher, "memory_cost", 1024)
+    def test_argon2_profile_hashes_and_verifies(self):
+        with override_settings(PASSWORD_HASHERS=settings.PASSWORD_HASHER_PROFILES["argon2"]):
+            user = self.create_user()
+            self.assertTrue(user.password.startswith("argon2$"))
+            self.assertEqual(self.login(), user)
+
+    def test_wrong_password_keeps_hash(self):
+        user = self.create_user()
+        encoded = user.password
+
+        self.assertIsNone(authenticate(username="student@example.com", password="wrong"))
+        user.refresh_from_db()
+        self.assertEqual(user.password, encoded)
+
+    def test_benchmark_rejects_non_positive_seconds(self):
+        with self.assertRaises(CommandError):
+            call_command("benchmark_password_hashers", "--seconds", "0")
+
+
+class SessionEngineQueryTests(FeedbackTestCase):
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.student)
+        # Warm the class card fragment so only session/auth queries differ
+        self.client.get(reverse("demo_class_list"))
+
+    def test_db_sessions_read_django_session_every_request(self):
+        # session, user, class list version
+        with self.assertNumQueries(3):
+            self.client.get(reverse("demo_class_list"))
+
+    @override_settings(SESSION_ENGINE="django.contrib.sessions.backends.cached_db")
+    def test_cached_db_sessions_skip_django_session(self):
+        # SessionMiddleware binds its engine on first use, so start a new client
+        self.client = self.client_class()
+        self.client.force_login(self.student)
+        self.client.get(reverse("demo_class_list"))
+
+        # user, class list version
+        with self.assertNumQueries(2):
+            self.client.get(reverse("demo_class_list"))
+
+
+class PurgeExpiredSessionsTests(TestCase):
+    def create_session(self, key, expires_in):
+        return Session.objects.create(
+            session_key=key, session_data="", expire_date=timezone.now() + timedelta(seconds=expires_in),
+        )
+
+    def test_deletes_only_expired_sessions(self):
+        for n in range(5):
+            self.create_session(f"expired{n}", -60)
+        self.create_session("live", 3600)
+
+        call_command("purge_expired_sessions", "--chunk-size", "2", stdout=StringIO())
+        self.assertEqual(list(Session.objects.values_list("session_key", flat=True)), ["live"])
+
+    def test_session_renewed_after_select_is_kept(self):
+        self.create_session("renewed", -60)
+        delete = QuerySet.delete
+
+        def renew_then_delete(queryset):
+            Session.objects.filter(pk="renewed").update(expire_date=timezone.now() + timedelta(hours=1))
+            return delete(queryset)
+
+        with mock.patch.object(QuerySet, "delete", renew_then_delete):
+            call_command("purge_expired_sessions", stdout=StringIO())
+        self.assertTrue(Session.objects.filter(pk="renewed").exists())
+
+    def test_rejects_chunk_size_below_one(self):
+        for chunk_size in ("0", "-1"):
+            with self.assertRaises(CommandError):
+                call_command("purge_expired_sessions", "--chunk-size", chunk_size)
+
+
+# Transactional: on Postgres the feed only returns committed changes
+class FeedbackChangeFeedTests(FeedbackFixtures, TransactionTestCase):
+    def setUp(self):
+        self.create_fixtures()
+        self.staff = User.objects.create_user("staff@example.com", "staff@example.com", is_staff=True)
+
+    def test_insert_update_delete_are_recorded(self):
+        feedback = self.create_feedback()
+        feedback_id = feedback.pk
+        feedback.rating = 5
+        feedback.save()
+        feedback.delete()
+
+        changes = list(FeedbackChange.objects.order_by("seq"))
+        self.assertEqual(
+            [(c.feedback_id, c.action) for c in changes],
+            [(feedback_id, "insert"), (feedback_id, "update"), (feedback_id, "delete")],
+        )
+        self.assertEqual(changes[0].data["rating"], 4)
+        self.assertEqual(changes[1].data["rating"], 5)
+        self.assertIsNone(changes[2].data)
+
+    def test_failed_log_insert_rolls_back_save(self):
+        with mock.patch.object(FeedbackChange, "record", side_effect=DatabaseError):
+            with self.assertRaises(DatabaseError):
+                self.create_feedback()
+        self.assertFalse(Feedback.objects.exists())
+
+    @skipUnless(connection.vendor == "postgresql", "Postgres orders the feed by transaction id")
+    def test_since_waits_for_lower_seq_still_in_flight(self):
+        in_flight, release = threading.Event(), threading.Event()
+
+        def slow_submit():
+            try:
+                with transaction.atomic():
+                    self.create_feedback(3)
+                    in_flight.set()
+                    release.wait(10)
+            finally:
+                connection.close()
+
+        writer = threading.Thread(target=slow_submit)
+        writer.start()
+        try:
+            self.assertTrue(in_flight.wait(10))
+            # Commits a higher seq while the lower one is still open
+            self.create_feedback(5)
+            self.assertEqual(list(FeedbackChange.objects.since(0)), [])
+        finally:
+            release.set()
+            writer.join()
+
+        changes = list(FeedbackChange.objects.since(0))
+        self.assertEqual([c.data["rating"] for c in changes], [3, 5])
+        self.assertEqual(list(FeedbackChange.objects.since(changes[0].seq)), changes[1:])
+
+    def test_changes_endpoint_paginates(self):
+        for rating in (3, 4, 5):
+            self.create_feedback(rating)
+        seqs = list(FeedbackChange.objects.order_by("seq").values_list("seq", flat=True))
+        self.client.force_login(self.staff)
+
+        page = self.client.get(reverse("feedback_changes"), {"limit": 2}).json()
+        self.assertEqual([c["seq"] for c in page["changes"]], seqs[:2])
+        self.assertEqual(page["next_after"], seqs[1])
+        self.assertTrue(page["has_more"])
+
+        page = self.client.get(reverse("feedback_changes"), {"after": page["next_after"]}).json()
+        self.assertEqual([c["seq"] for c in page["changes"]], seqs[2:])
+        self.assertEqual(page["next_after"], seqs[2])
+        self.assertFalse(page["has_more"])
+
+        response = self.client.get(reverse("feedback_changes"), {"after": "abc"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_changes_endpoint_requires_staff(self):
+        self.client.force_login(self.student)
+        response = self.client.get(reverse("feedback_changes"))
+        self.assertEqual(response.status_code, 302)
+
+    def test_export_resumes_from_checkpoint(self):
+        self.create_feedback(3)
+        self.create_feedback(4)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            checkpoint = Path(tmp) / "checkpoint"
+            output = Path(tmp) / "changes.jsonl"
+            args = ["export_feedback_changes", "--checkpoint", checkpoint, "--output", output, "--batch-size", "1"]
+
+            call_command(*args, stderr=StringIO())
+            first_run = [json.loads(line) for line in output.read_text().splitlines()]
+            self.assertEqual(len(first_run), 2)
+            self.assertEqual(int(checkpoint.read_text()), first_run[-1]["seq"])
+
+            self.create_feedback(5)
+            call_command(*args, stderr=StringIO())
+            lines = [json.loads(line) for line in output.read_text().splitlines()]
+            self.assertEqual(len(lines), 3)
+            self.assertEqual(lines[-1]["data"]["rating"], 5)
+            self.assertEqual(int(checkpoint.read_text()), lines[-1]["seq"])
+
+    def test_export_rejects_batch_size_below_one(self):
+        for batch_size in ("0", "-1"):
+            with self.assertRaises(CommandError):
+                call_command("export_feedback_changes", "--batch-size", batch_size)
+
+
+class AdminPerformanceModeTests(FeedbackTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        Feedback.objects.bulk_create(
+            Feedback(
+                demo_class=cls.demo_class,
+                student_name=f"Student {n}",
+                student_email=f"student{n}@example.com",
+                rating=1 + n % 5,
+                liked_most="Examples",
+                to_improve="Pace",
+            )
+            for n in range(150)
+        )
+        cls.admin = User.objects.create_superuser("admin@example.com", "admin@example.com", "pass")
+
+    def setUp(self):
+        self.client.force_login(self.admin)
+        self.url = reverse("admin:feedback_feedback_changelist")
+
+    @override_settings(ADMIN_PERFORMANCE_MODE=True)
+    def test_older_entries_link_continues_after_last_row(self):
+        response = self.client.get(self.url)
+        rows = list(response.context["cl"].result_list)
+        self.assertEqual(len(rows), 100)
+        self.assertIsNone(response.context["cl"].date_hierarchy)
+
+        older_url = response.context["cl"].older_url
+        self.assertEqual(older_url, f"?before={rows[-1].pk}")
+        self.assertContains(response, "Older entries")
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url + older_url)
+        counts = [q["sql"] for q in queries if "COUNT(" in q["sql"]]
+        self.assertTrue(counts)
+        self.assertTrue(all("LIMIT 201" in sql for sql in counts), counts)
+        older_rows = list(response.context["cl"].result_list)
+        self.assertEqual(len(older_rows), 50)
+        self.assertLess(older_rows[0].pk, rows[-1].pk)
+        self.assertIsNone(response.context["cl"].older_url)
+
+    @override_settings(ADMIN_PERFORMANCE_MODE=True)
+    def test_invalid_keyset_value_is_rejected(self):
+        response = self.client.get(self.url, {"before": "abc"})
+        self.assertRedirects(response, self.url + "?e=1", fetch_redirect_response=False)
+
+    def test_plain_changelist_when_mode_is_off(self):
+        response = self.client.get(self.url)
+        cl = response.context["cl"]
+        self.assertEqual(cl.date_hierarchy, "created_at")
+        self.assertFalse(hasattr(cl, "older_url"))
+        self.assertEqual(cl.full_result_count, 150)
+        self.assertNotContains(response, "Older entries")
+
+    def test_estimate_only_used_for_unfiltered_lists(self):
+        plan = '{"Plan": {"Plan Rows": 5000000}}'
+        with mock.patch.object(connection, "vendor", "postgresql"), \
+                mock.patch("django.db.models.query.QuerySet.explain", return_value=plan), \
+                override_settings(ADMIN_ESTIMATED_COUNT_THRESHOLD=1000):
+            self.assertEqual(EstimatedCountPaginator(Feedback.objects.order_by("-pk"), 100).count, 5000000)
+            self.assertEqual(EstimatedCountPaginator(Feedback.objects.filter(rating=5).order_by("-pk"), 100).count, 30)
+
+    @override_settings(ADMIN_PERFORMANCE_MODE=True, ADMIN_ESTIMATED_COUNT_THRESHOLD=20)
+    def test_filtered_count_is_capped(self):
+        paginator = EstimatedCountPaginator(Feedback.objects.filter(rating=5).order_by("-pk"), 10)
+        self.assertEqual(paginator.count, 21)
+        self.assertTrue(paginator.count_capped)
+
+        response = self.client.get(self.url, {"rating__exact": 5})
+        self.assertContains(response, "21+ feedbacks")
+
+
+class ClassCardFragmentCacheTests(FeedbackTestCase):
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.student)
+
+    def test_class_edit_invalidates_cached_cards(self):
+        self.assertContains(self.client.get(reverse("demo_class_list")), "Django basics")
+
+        self.demo_class.title = "Advanced Django"
+        self.demo_class.save()
+        self.assertContains(self.client.get(reverse("demo_class_list")), "Advanced Django")
+
+    def test_trainer_rename_invalidates_cached_cards(self):
+        for name in ("demo_class_list", "feedback_summary"):
+            self.assertContains(self.client.get(reverse(name)), "Asha")
+
+        self.trainer.name = "Asha Rao"
+        self.trainer.save()
+        for name in ("demo_class_list", "feedback_summary"):
+            self.assertContains(self.client.get(reverse(name)), "Asha Rao")
+
+    def test_new_feedback_invalidates_cached_summary(self):
+        self.assertContains(self.client.get(reverse("feedback_summary")), "Feedback Count : 0")
+
+        self.create_feedback(5)
+        self.assertContains(self.client.get(reverse("feedback_summary")), "Feedback Count : 1")
+
+    def test_benchmark_rejects_counts_below_one(self):
+        for option in ("--classes", "--repeat"):
+            with self.assertRaises(CommandError):
+                call_command("benchmark_templates", option, "0")
+
+
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
+class GenerateSampleDataTests(TestCase):
+    def generate(self, *args):
+        call_command(
+            "generate_sample_data", "--trainers", "3", "--classes", "20", "--users", "15",
+            "--feedback", "200", *args, stdout=StringIO(),
+        )
+
+    def snapshot(self):
+        return list(
+            Feedback.objects.order_by("pk").values_list(
+                "demo_class__title", "student_email", "rating", "liked_most", "to_improve", "created_at",
+            )
+        )
+
+    def clear(self):
+        for model in (Feedback, DemoClass, Trainer, Profile, User):
+            model.objects.all().delete()
+
+    def test_output_does_not_depend_on_batch_size(self):
+        self.generate("--batch-size", "5000")
+        first = self.snapshot()
+        self.clear()
+        self.generate("--batch-size", "7")
+        self.assertEqual(self.snapshot(), first)
+
+    def test_no_feedback_before_class_end_or_after_anchor(self):
+        # Classes in the last few days, so much of the long tail overflows
+        self.generate("--anchor", "2025-03-01", "--days", "3", "--classes", "200")
+        self.assertTrue(Feedback.objects.exists())
+        anchor = datetime(2025, 3, 1, tzinfo=dt_timezone.utc)
+        for feedback in Feedback.objects.select_related("demo_class"):
+            ends_at = feedback.demo_class.date + timedelta(minutes=feedback.demo_class.duration_minutes)
+            self.assertLessEqual(ends_at, feedback.created_at)
+            self.assertLess(feedback.created_at, anchor)
+
+    def test_rejects_invalid_counts(self):
+        for args in (["--batch-size", "0"], ["--batch-size", "-1"], ["--users", "-1"], ["--trainers", "0"]):
+            with self.assertRaises(CommandError):
+                self.generate(*args)
+        self.assertFalse(User.objects.exists())
+
+    def test_no_classes_skips_feedback(self):
+        self.generate("--classes", "0", "--feedback", "0")
+        self.generate("--classes", "0", "--seed", "7")
+        self.assertFalse(Feedback.objects.exists())
+
+    def test_rerun_with_same_seed_writes_nothing(self):
+        self.generate()
+        counts = (Trainer.objects.count(), DemoClass.objects.count(), User.objects.count())
+
+        with self.assertRaises(CommandError):
+            self.generate()
+        self.assertEqual((Trainer.objects.count(), DemoClass.objects.count(), User.objects.count()), counts)
+
+
+# Transactional: the command closes the connection between iterations
+class BenchmarkDbConnectionsTests(TransactionTestCase):
+    # An in-memory SQLite connection ignores close(), so only Postgres
+    # really reconnects
+    @skipUnless(connection.vendor == "postgresql", "needs a backend that reconnects")
+    def test_connect_mode_opens_a_connection_per_iteration(self):
+        db = connections["default"]
+        db.close()
+        out = StringIO()
+        with mock.patch.object(db, "get_new_connection", wraps=db.get_new_connection) as connect:
+            call_command("benchmark_db_connections", "--iterations", "3", stdout=out)
+
+        # warm-up, then one per "connect" iteration and none while reused
+        self.assertEqual(connect.call_count, 4)
+        self.assertIn("connect + SELECT 1", out.getvalue())
+        self.assertIn("reused  + SELECT 1", out.getvalue())
+
+    def test_rejects_zero_iterations(self):
+        with self.assertRaises(CommandError):
+            call_command("benchmark_db_connections", "--iterations", "0")
@@ -10,6 +10,8 @@ urlpatterns = [
     path('class/<int:demo_id>/feedback/', views.submit_feedback, name='submit_feedback'),
     path('class/<int:demo_id>/thank-you/', views.feedback_thank_you, name='feedback_thank_you'),
     path('staff/summary/', views.feedback_summary, name='feedback_summary'),
+    path('staff/changes/', views.feedback_changes, name='feedback_changes'),
+    path('staff/db-pool/', views.db_pool_stats, name='db_pool_stats'),
 
     # OTP and password reset
     path('verify-otp/', views.verify_otp, name='verify_otp'),
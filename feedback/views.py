@@ -4,15 +4,18 @@ import logging
 
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth import authenticate, login, logout
-from django.contrib.auth.decorators import login_required
+from django.contrib.auth.decorators import login_required, user_passes_test
 from django.contrib import messages
-from django.db.models import Avg, Count
+from django.db import connection
+from django.db.models import Avg, Count, Max
+from django.http import JsonResponse
+from django.utils.functional import SimpleLazyObject
 
 from sendgrid import SendGridAPIClient
 from sendgrid.helpers.mail import Mail
 
 from .forms import FeedbackForm
-from .models import DemoClass, Feedback, User, Profile
+from .models import DemoClass, Feedback, FeedbackChange, User, Profile
 
 logger = logging.getLogger(__name__)
 
@@ -277,10 +280,30 @@ def logout_user(request):
 # ---------------------------
 # Feedback System
 # ---------------------------
+# The class cards are cached as one template fragment keyed by these
+# versions. On a cache hit the templates never evaluate the (lazy) querysets.
+def demo_class_version():
+    v = DemoClass.objects.aggregate(
+        count=Count("id"), updated=Max("updated_at"), trainer_updated=Max("trainer__updated_at"),
+    )
+    return f"{v['count']}:{v['updated']}:{v['trainer_updated']}"
+
+
+# Feedback written without signals (bulk_create, queryset.update(), the
+# generate_sample_data command) adds no FeedbackChange row, so the summary
+# stays stale until the fragment's 600s timeout.
+def feedback_summary_version():
+    last_change = FeedbackChange.objects.aggregate(seq=Max("seq"))["seq"]
+    return f"{demo_class_version()}:{last_change}"
+
+
 @login_required(login_url="login_user")
 def demo_class_list(request):
-    classes = DemoClass.objects.filter(is_active=True).order_by("date")
-    return render(request, "reviews/demo_class_list.html", {"classes": classes})
+    classes = DemoClass.objects.filter(is_active=True).select_related("trainer").order_by("date")
+    return render(request, "reviews/demo_class_list.html", {
+        "classes": classes,
+        "classes_version": demo_class_version(),
+    })
 
 
 @login_required(login_url="login_user")
@@ -326,19 +349,66 @@ def feedback_thank_you(request, demo_id):
 
 @login_required(login_url="login_user")
 def feedback_summary(request):
-    per_class = DemoClass.objects.annotate(
+    per_class = DemoClass.objects.select_related("trainer").annotate(
         feedback_count=Count("feedbacks"),
         avg_rating=Avg("feedbacks__rating")
     ).order_by("-date")
 
-    overall = Feedback.objects.aggregate(
+    overall = SimpleLazyObject(lambda: Feedback.objects.aggregate(
         total_feedback=Count("id"),
         avg_rating=Avg("rating"),
-    )
+    ))
 
     return render(request, "reviews/feedback_summary.html", {
         "per_class": per_class,
         "overall": overall,
+        "summary_version": feedback_summary_version(),
+    })
+
+
+# ---------------------------
+# Change feed for warehouse sync
+# ---------------------------
+CHANGE_FEED_PAGE_SIZE = 500
+CHANGE_FEED_MAX_PAGE_SIZE = 5000
+
+
+@user_passes_test(lambda u: u.is_staff, login_url="login_user")
+def feedback_changes(request):
+    try:
+        after = max(int(request.GET.get("after", 0)), 0)
+        limit = int(request.GET.get("limit", CHANGE_FEED_PAGE_SIZE))
+    except ValueError:
+        return JsonResponse({"error": "after and limit must be integers"}, status=400)
+    limit = min(max(limit, 1), CHANGE_FEED_MAX_PAGE_SIZE)
+
+    # fetch one extra row to know whether another page exists
+    changes = list(FeedbackChange.objects.since(after)[:limit + 1])
+    has_more = len(changes) > limit
+    changes = changes[:limit]
+
+    return JsonResponse({
+        "changes": [change.as_dict() for change in changes],
+        "next_after": changes[-1].seq if changes else after,
+        "has_more": has_more,
     })
 
 
+# ---------------------------
+# DB pool metrics (per gunicorn worker)
+# ---------------------------
+@user_passes_test(lambda u: u.is_staff, login_url="login_user")
+def db_pool_stats(request):
+    # Counters belong to the worker process that served this request
+    pool = getattr(connection, "pool", None)
+    if pool is None:
+        return JsonResponse({"pid": os.getpid(), "pooled": False})
+
+    stats = pool.get_stats()
+    requests_num = stats.get("requests_num", 0)
+    return JsonResponse({
+        "pid": os.getpid(),
+        "pooled": True,
+        "avg_checkout_wait_ms": stats.get("requests_wait_ms", 0) / requests_num if requests_num else 0,
+        "stats": stats,
+    })
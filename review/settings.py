@@ -1,6 +1,7 @@
 from pathlib import Path
 import os
 import dj_database_url
+from django.core.exceptions import ImproperlyConfigured
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -66,10 +67,92 @@ DATABASES = {
     "default": dj_database_url.config(
         default=os.getenv("DATABASE_URL"),
         conn_max_age=600,
+        conn_health_checks=True,
         ssl_require=True
     )
 }
 
+# Connection pool per gunicorn worker (psycopg_pool). CONN_HEALTH_CHECKS
+# makes the pool check each connection on checkout, so connections dropped
+# while idle are replaced before a query fails.
+# The Procfile runs sync workers, which serve one request at a time, so one
+# connection per worker is all they can use. With threaded workers
+# (gunicorn --threads N) set DB_POOL_MIN_SIZE/DB_POOL_MAX_SIZE to N.
+if os.getenv("DB_POOL", "False") == "True":
+    if DATABASES["default"].get("ENGINE") != "django.db.backends.postgresql":
+        raise ImproperlyConfigured("DB_POOL=True needs a PostgreSQL DATABASE_URL.")
+    # Pooling replaces persistent connections; Django rejects both together
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
+    DATABASES["default"].setdefault("OPTIONS", {})["pool"] = {
+        "min_size": int(os.getenv("DB_POOL_MIN_SIZE", "1")),
+        "max_size": int(os.getenv("DB_POOL_MAX_SIZE", "1")),
+        "timeout": float(os.getenv("DB_POOL_TIMEOUT", "10")),
+        "max_idle": float(os.getenv("DB_POOL_MAX_IDLE", "300")),
+    }
+
+
+# ---------------------------
+# CACHE (Redis when REDIS_URL is set, per-process memory otherwise)
+# ---------------------------
+if os.getenv("REDIS_URL"):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.getenv("REDIS_URL"),
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
+
+# ---------------------------
+# ADMIN
+# ---------------------------
+# Performance mode for the Feedback/DemoClass changelists: estimated counts,
+# no date hierarchy, keyset navigation (see feedback/admin.py)
+ADMIN_PERFORMANCE_MODE = os.getenv("ADMIN_PERFORMANCE_MODE", "False") == "True"
+ADMIN_ESTIMATED_COUNT_THRESHOLD = int(os.getenv("ADMIN_ESTIMATED_COUNT_THRESHOLD", "100000"))
+ADMIN_FILTER_CHOICES_CACHE_SECONDS = int(os.getenv("ADMIN_FILTER_CHOICES_CACHE_SECONDS", "300"))
+
+
+# ---------------------------
+# SESSIONS & MESSAGES
+# ---------------------------
+# "cached_db" serves session reads from the cache and only hits
+# django_session on writes or cache misses. Signed-cookie sessions are not
+# offered: the registration and reset flows keep the OTP and the pending
+# password in the session, and a signed cookie is readable by the client.
+SESSION_ENGINES = {
+    "db": "django.contrib.sessions.backends.db",
+    "cached_db": "django.contrib.sessions.backends.cached_db",
+    "cache": "django.contrib.sessions.backends.cache",
+}
+
+SESSION_BACKEND = os.getenv("SESSION_BACKEND", "db")
+if SESSION_BACKEND not in SESSION_ENGINES:
+    raise ImproperlyConfigured(
+        f"SESSION_BACKEND must be one of {', '.join(SESSION_ENGINES)}, got {SESSION_BACKEND!r}."
+    )
+
+# The local-memory cache is per gunicorn worker: each worker would keep its
+# own copy of a session, so logouts and OTP updates would not be seen by the
+# other workers. Cache-backed sessions need the shared Redis cache.
+if SESSION_BACKEND != "db" and not os.getenv("REDIS_URL") and not DEBUG:
+    raise ImproperlyConfigured(
+        f"SESSION_BACKEND={SESSION_BACKEND!r} needs a shared cache; set REDIS_URL."
+    )
+
+SESSION_ENGINE = SESSION_ENGINES[SESSION_BACKEND]
+
+# Flash messages are short notices, so keep them out of the session entirely
+MESSAGE_STORAGE = os.getenv(
+    "MESSAGE_STORAGE", "django.contrib.messages.storage.cookie.CookieStorage"
+)
+
 
 # ---------------------------
 # PASSWORD VALIDATORS
@@ -82,6 +165,51 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# ---------------------------
+# PASSWORD HASHING
+# ---------------------------
+# The first hasher of the selected profile hashes new passwords; the rest
+# stay listed so existing hashes still verify and get upgraded on login.
+PASSWORD_HASHER_PROFILES = {
+    "pbkdf2": [
+        "feedback.hashers.TunedPBKDF2PasswordHasher",
+        "feedback.hashers.TunedScryptPasswordHasher",
+        "feedback.hashers.TunedArgon2PasswordHasher",
+    ],
+    "scrypt": [
+        "feedback.hashers.TunedScryptPasswordHasher",
+        "feedback.hashers.TunedPBKDF2PasswordHasher",
+        "feedback.hashers.TunedArgon2PasswordHasher",
+    ],
+    "argon2": [
+        "feedback.hashers.TunedArgon2PasswordHasher",
+        "feedback.hashers.TunedPBKDF2PasswordHasher",
+        "feedback.hashers.TunedScryptPasswordHasher",
+    ],
+}
+
+PASSWORD_HASHER_PROFILE = os.getenv("PASSWORD_HASHER_PROFILE", "pbkdf2")
+if PASSWORD_HASHER_PROFILE not in PASSWORD_HASHER_PROFILES:
+    raise ImproperlyConfigured(
+        f"PASSWORD_HASHER_PROFILE must be one of {', '.join(PASSWORD_HASHER_PROFILES)}, "
+        f"got {PASSWORD_HASHER_PROFILE!r}."
+    )
+
+PASSWORD_HASHERS = PASSWORD_HASHER_PROFILES[PASSWORD_HASHER_PROFILE] + [
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+]
+
+# Cost parameters; unset means Django's default for that hasher
+PBKDF2_ITERATIONS = os.getenv("PBKDF2_ITERATIONS")
+SCRYPT_WORK_FACTOR = os.getenv("SCRYPT_WORK_FACTOR")
+SCRYPT_BLOCK_SIZE = os.getenv("SCRYPT_BLOCK_SIZE")
+SCRYPT_PARALLELISM = os.getenv("SCRYPT_PARALLELISM")
+ARGON2_TIME_COST = os.getenv("ARGON2_TIME_COST")
+ARGON2_MEMORY_COST = os.getenv("ARGON2_MEMORY_COST")
+ARGON2_PARALLELISM = os.getenv("ARGON2_PARALLELISM")
+
+
 # ---------------------------
 # INTERNATIONALIZATION
 # ---------------------------